@@ -1,3 +1,4 @@
+import os
 import sys
 import subprocess
 from typing import Annotated, Optional
@@ -8,7 +9,6 @@ import uvicorn
 
 from brain_box.security import get_password_hash
 from brain_box.config import settings, _xdg_config_home
-from brain_box.main import app as main_app
 
 SYSTEMD_USER_PATH = Path(_xdg_config_home) / "systemd" / "user" / "brain_box.service"
 SERVICE_TEMPLATE = """
@@ -44,10 +44,16 @@ def start(
     final_host = host or settings.general.host
     final_port = port or settings.general.port
 
+    # The app is passed as an import string so uvicorn can fork worker
+    # processes; uvloop and httptools (C event loop and HTTP parser,
+    # shipped with uvicorn[standard]) are requested explicitly.
     uvicorn.run(
-        main_app,
+        "brain_box.main:app",
         host=final_host,
         port=final_port,
+        workers=settings.general.workers,
+        loop="uvloop",
+        http="httptools",
         ssl_certfile=settings.general.cert,
         ssl_keyfile=settings.general.cert_key,
     )
@@ -70,23 +76,31 @@ def install_service(
 
     service_content = SERVICE_TEMPLATE.format(exec_cmd=exec_cmd)
 
-    if SYSTEMD_USER_PATH.exists() and not force:
+    overwriting = SYSTEMD_USER_PATH.exists()
+
+    if overwriting and not force:
         typer.secho(
             f"⚠️  Service file exists: {SYSTEMD_USER_PATH}", fg=typer.colors.YELLOW
         )
         raise typer.Exit(code=1)
 
-    SYSTEMD_USER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SYSTEMD_USER_PATH.write_text(service_content, encoding="utf-8")
+    os.makedirs(SYSTEMD_USER_PATH.parent, exist_ok=True)
+    with open(SYSTEMD_USER_PATH, "wb") as service_file:
+        service_file.write(service_content.encode("utf-8"))
 
     typer.secho(
         f"✅ Generated service file at: {SYSTEMD_USER_PATH}", fg=typer.colors.GREEN
     )
 
     try:
-        subprocess.run(["systemctl", "--user", "daemon-reload"], check=True)
+        # systemd only needs a reload when an already-known unit file changed;
+        # for a fresh unit, `enable --now` picks it up on its own.
+        if overwriting:
+            subprocess.run(["systemctl", "--user", "daemon-reload"], check=True)
+
         subprocess.run(
-            ["systemctl", "--user", "enable", "--now", SYSTEMD_USER_PATH], check=True
+            ["systemctl", "--user", "enable", "--now", SYSTEMD_USER_PATH.name],
+            check=True,
         )
         typer.secho("🎉 Brain Box service started!", fg=typer.colors.CYAN)
     except subprocess.CalledProcessError:
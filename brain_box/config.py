@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Type
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field
 from pydantic_settings import (
@@ -26,6 +27,7 @@ class General(BaseModel):
 
     host: str = Field(default="127.0.0.1", description="Host to bind.")
     port: int = Field(default=8000, description="Port to bind.")
+    workers: int = Field(default=1, description="Number of worker processes.")
     cert: Optional[str] = Field(
         default=None, description="Path to the certificate file."
     )
@@ -60,6 +62,29 @@ class Security(BaseModel):
     )
 
 
+class CachedTomlSettingsSource(TomlConfigSettingsSource):
+    """TOML source that memoizes parsed files by path and modification time.
+
+    Repeat constructions within one process (tests, workers) reuse the
+    already-parsed document instead of re-reading and re-parsing the file.
+    """
+
+    _cache: ClassVar[Dict[Path, Tuple[int, Dict[str, Any]]]] = {}
+
+    def _read_file(self, file_path) -> Dict[str, Any]:
+        path = Path(file_path)
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._cache.get(path)
+
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        data = super()._read_file(file_path)
+        self._cache[path] = (mtime_ns, data)
+
+        return data
+
+
 class Settings(BaseSettings):
     """Main settings for Brain Box.
 
@@ -90,12 +115,29 @@ class Settings(BaseSettings):
     ) -> Tuple[PydanticBaseSettingsSource, ...]:
         """Defines the priority of configuration loaders."""
 
-        return (
-            init_settings,
-            env_settings,
-            TomlConfigSettingsSource(settings_cls, CWD_CONFIG_PATH),
-            TomlConfigSettingsSource(settings_cls, XDG_CONFIG_PATH),
-        )
+        sources: list[PydanticBaseSettingsSource] = [init_settings, env_settings]
+
+        # Only wire up TOML sources for files that actually exist, so
+        # construction skips the read + parse for absent config files.
+        if CWD_CONFIG_PATH.is_file():
+            sources.append(CachedTomlSettingsSource(settings_cls, CWD_CONFIG_PATH))
+        if XDG_CONFIG_PATH.is_file():
+            sources.append(CachedTomlSettingsSource(settings_cls, XDG_CONFIG_PATH))
+
+        return tuple(sources)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Builds the settings once and caches them for the process lifetime."""
+
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    """Lazily resolves the ``settings`` module attribute (PEP 562)."""
 
+    if name == "settings":
+        return get_settings()
 
-settings = Settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
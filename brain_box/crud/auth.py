@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlmodel import Session, delete, select
 
 from brain_box.models.auth import RefreshToken, RefreshTokenCreate
@@ -18,9 +19,13 @@ def create_refresh_token(
 
     db_refresh_token = RefreshToken.model_validate(refresh_token_in)
 
-    session.add(db_refresh_token)
+    statement = (
+        insert(RefreshToken)
+        .values(db_refresh_token.model_dump())
+        .returning(RefreshToken)
+    )
+    db_refresh_token = session.execute(statement).scalar_one()
     session.commit()
-    session.refresh(db_refresh_token)
 
     return db_refresh_token
 
@@ -83,6 +88,6 @@ def delete_refresh_token_by_hash(session: Session, refresh_token_hash: str) -> N
         refresh_token: The hash of the refresh token.
     """
 
-    statement = delete(RefreshToken).where(RefreshToken.hash == refresh_token_hash)  # type: ignore
-    session.exec(statement)
+    statement = delete(RefreshToken).where(RefreshToken.hash == refresh_token_hash)
+    session.execute(statement)
     session.commit()
@@ -1,10 +1,34 @@
-from sqlalchemy import text
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import delete, insert, text, update
 from sqlmodel import Session
 
+from brain_box.crud.errors import NotFoundError
 from brain_box.models.entry import Entry, EntryCreate, EntryUpdate
-from brain_box.models.topic import Topic
 from brain_box.utils import sanitize_alnum
 
+_SEARCH_ENTRIES_SQL = text("""
+    SELECT e.id, snippet(entry_fts, -1, '<b>', '</b>', '...', 20) AS description, e.created_at, e.updated_at, e.topic_id, t.name, t.parent_id
+    FROM entry e
+    JOIN topic t ON t.id = e.topic_id
+    JOIN entry_fts ON e.id = entry_fts.rowid
+    WHERE entry_fts MATCH :query
+    ORDER BY bm25(entry_fts)
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@lru_cache(maxsize=1024)
+def _fts_query(q: str) -> str:
+    """Builds the sanitized prefix MATCH expression for a raw query.
+
+    Live-search traffic repeats the same (prefixes of) queries per
+    keystroke, so the sanitized expression is memoized.
+    """
+
+    return f"{sanitize_alnum(q.strip())}*"
+
 
 def create_entry(session: Session, entry_in: EntryCreate) -> Entry:
     """Creates a new learning entry in the database.
@@ -17,15 +41,43 @@ def create_entry(session: Session, entry_in: EntryCreate) -> Entry:
         The newly created entry model instance.
     """
 
-    db_entry = Entry.model_validate(entry_in)
+    # entry_in is already-validated EntryCreate (a strict field subset),
+    # so model_construct just fills defaults without a second validation
+    # pass; the instance only feeds the insert values below.
+    db_entry = Entry.model_construct(**entry_in.model_dump())
 
-    session.add(db_entry)
+    statement = (
+        insert(Entry).values(db_entry.model_dump(exclude={"id"})).returning(Entry)
+    )
+    db_entry = session.execute(statement).scalar_one()
     session.commit()
-    session.refresh(db_entry)
 
     return db_entry
 
 
+def create_entries_bulk(session: Session, entries_in: list[EntryCreate]) -> list[Entry]:
+    """Creates multiple entries in a single transaction.
+
+    The whole batch is flushed and committed together, so it costs one
+    commit (and one fsync) instead of one per entry. Intended for
+    importers and other bulk callers.
+
+    Args:
+        session: The database session.
+        entries_in: The data for the new entries.
+
+    Returns:
+        The newly created entry model instances.
+    """
+
+    db_entries = [Entry.model_validate(entry_in) for entry_in in entries_in]
+
+    session.add_all(db_entries)
+    session.commit()
+
+    return db_entries
+
+
 def get_entry(session: Session, entry_id: int) -> Entry | None:
     """Retrieves a single entry by its ID.
 
@@ -40,45 +92,76 @@ def get_entry(session: Session, entry_id: int) -> Entry | None:
     return session.get(Entry, entry_id)
 
 
-def update_entry(session: Session, entry: Entry, entry_in: EntryUpdate) -> Entry:
+def update_entry(session: Session, entry_id: int, entry_in: EntryUpdate) -> Entry:
     """Updates an existing entry in the database.
 
+    The existence check and the update are one UPDATE ... RETURNING
+    statement, so the common case costs a single round-trip.
+
     Args:
         session: The database session.
-        entry: The existing entry model instance to update.
+        entry_id: The ID of the entry to update.
         entry_in: The new data for the entry.
 
     Returns:
         The updated entry model instance.
+
+    Raises:
+        NotFoundError: If no entry with `entry_id` exists.
     """
 
     entry_data = entry_in.model_dump(exclude_unset=True)
 
-    entry.sqlmodel_update(entry_data)
-    session.add(entry)
+    if not entry_data:
+        db_entry = session.get(Entry, entry_id)
+
+        if db_entry is None:
+            raise NotFoundError("Entry not found")
+
+        return db_entry
+
+    statement = (
+        update(Entry).where(Entry.id == entry_id).values(**entry_data).returning(Entry)
+    )
+    db_entry = session.execute(statement).scalar_one_or_none()
+
+    if db_entry is None:
+        raise NotFoundError("Entry not found")
+
     session.commit()
-    session.refresh(entry)
 
-    return entry
+    return db_entry
 
 
-def delete_entry(session: Session, entry: Entry) -> None:
+def delete_entry(session: Session, entry_id: int) -> None:
     """Deletes an entry from the database.
 
     Args:
         session: The database session.
-        entry: The entry model instance to delete.
+        entry_id: The ID of the entry to delete.
+
+    Raises:
+        NotFoundError: If no entry with `entry_id` exists.
     """
 
-    session.delete(entry)
+    statement = delete(Entry).where(Entry.id == entry_id).returning(Entry.id)
+    deleted_id = session.execute(statement).scalar_one_or_none()
+
+    if deleted_id is None:
+        raise NotFoundError("Entry not found")
+
     session.commit()
 
 
 def search_entries(
     session: Session, q: str, limit: int = 25, skip: int = 0
-) -> list[Entry]:
+) -> list[dict[str, Any]]:
     """Searches for entries.
 
+    Results are assembled as plain dicts shaped like `EntryRead` instead
+    of full ORM instances, which skips the per-row model construction
+    and instrumentation cost on this read-only path.
+
     Args:
         session: The database session.
         q: The search string.
@@ -86,34 +169,29 @@ def search_entries(
         skip: The number of records to skip (for pagination).
 
     Returns:
-        A list of matching Entry model instances.
+        A list of matching entry rows, shaped like `EntryRead`.
     """
 
-    query_sql = text("""
-        SELECT e.id, snippet(entry_fts, -1, '<b>', '</b>', '...', 20) AS description, e.created_at, e.updated_at, e.topic_id, t.name, t.parent_id
-        FROM entry e
-        JOIN topic t ON t.id = e.topic_id
-        JOIN entry_fts ON e.id = entry_fts.rowid
-        WHERE entry_fts MATCH :query
-        LIMIT :limit OFFSET :offset
-    """)
-
-    result = session.connection().execute(
-        query_sql,
-        {"query": f"{sanitize_alnum(q.strip())}*", "limit": limit, "offset": skip},
+    result = session.execute(
+        _SEARCH_ENTRIES_SQL,
+        {"query": _fts_query(q), "limit": limit, "offset": skip},
     )
 
-    rows = result.fetchall()
     entries = [
-        Entry(
-            id=row.id,
-            description=row.description,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            topic_id=row.topic_id,
-            topic=Topic(id=row.topic_id, name=row.name, parent_id=row.parent_id),
-        )
-        for row in rows
+        {
+            "id": row["id"],
+            "description": row["description"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "topic_id": row["topic_id"],
+            "topic": {
+                "id": row["topic_id"],
+                "name": row["name"],
+                "parent_id": row["parent_id"],
+                "parent": None,
+            },
+        }
+        for row in result.mappings()
     ]
 
     return entries
@@ -1,3 +1,6 @@
+from typing import Iterator, Sequence
+
+from sqlalchemy import delete, exists, insert, text, true, update
 from sqlalchemy.orm import aliased
 from sqlmodel import Session, func, select
 
@@ -5,6 +8,26 @@ from brain_box.crud.errors import AlreadyExistsError, NotFoundError
 from brain_box.models.entry import Entry
 from brain_box.models.topic import Topic, TopicCreate, TopicUpdate
 
+_SEARCH_TOPICS_SQL = text("""
+    SELECT rowid FROM topic_fts
+    WHERE topic_fts MATCH :query
+    LIMIT :limit
+""")
+
+# Built once at import: the aggregate subqueries are immutable, so reusing
+# them keeps per-call statement construction minimal and lets SQLAlchemy's
+# compiled-statement cache key on the same objects across requests.
+_ENTRY_COUNTS = (
+    select(Entry.topic_id, func.count().label("c"))
+    .group_by(Entry.topic_id)
+    .subquery("entry_counts")
+)
+_CHILD_COUNTS = (
+    select(Topic.parent_id, func.count().label("c"))
+    .group_by(Topic.parent_id)
+    .subquery("child_counts")
+)
+
 
 def create_topic(session: Session, topic_in: TopicCreate) -> Topic:
     """Creates a new topic in the database.
@@ -17,28 +40,85 @@ def create_topic(session: Session, topic_in: TopicCreate) -> Topic:
         The newly created topic.
     """
 
-    topic_with_same_name = select(Topic).where(
-        func.lower(Topic.name) == topic_in.name.lower(),
+    duplicate_check = exists().where(
+        Topic.name_ci == topic_in.name.lower(),
         Topic.parent_id == topic_in.parent_id,
     )
+    parent_check = (
+        exists().where(Topic.id == topic_in.parent_id)
+        if topic_in.parent_id
+        else true()
+    )
 
-    parent_topic = select(Topic).where(Topic.id == topic_in.parent_id)
+    # Both existence checks ride along in one SELECT, so the happy path
+    # costs a single round-trip before the INSERT.
+    name_taken, parent_found = session.execute(
+        select(duplicate_check, parent_check)
+    ).one()
 
-    if session.exec(topic_with_same_name).first():
+    if name_taken:
         raise AlreadyExistsError("Topic name already in use")
 
-    if topic_in.parent_id and not session.exec(parent_topic).first():
+    if not parent_found:
         raise NotFoundError("Parent topic not found")
 
-    db_topic = Topic.model_validate(topic_in)
+    # topic_in is already-validated TopicCreate, so model_construct just
+    # fills defaults without a second validation pass; the instance only
+    # feeds the insert values below.
+    db_topic = Topic.model_construct(**topic_in.model_dump())
 
-    session.add(db_topic)
+    statement = (
+        insert(Topic)
+        .values(db_topic.model_dump(exclude={"id", "name_ci"}))
+        .returning(Topic)
+    )
+    db_topic = session.execute(statement).scalar_one()
     session.commit()
-    session.refresh(db_topic)
 
     return db_topic
 
 
+def create_topics_bulk(session: Session, topics_in: list[TopicCreate]) -> list[Topic]:
+    """Creates multiple topics in a single transaction.
+
+    Unlike `create_topic`, no per-item duplicate or parent checks are
+    performed; the batch is flushed and committed as one unit so bulk
+    importers pay a single commit (and fsync) for the whole set. Invalid
+    parents surface as constraint violations from the database.
+
+    Args:
+        session: The database session.
+        topics_in: The data for the new topics.
+
+    Returns:
+        The newly created topic model instances.
+    """
+
+    db_topics = [Topic.model_validate(topic_in) for topic_in in topics_in]
+
+    session.add_all(db_topics)
+    session.commit()
+
+    return db_topics
+
+
+def topic_exists(session: Session, topic_id: int) -> bool:
+    """Checks whether a topic with the given ID exists.
+
+    A bare EXISTS probe on the primary key, for callers that only need
+    the check and not the row or its counts.
+
+    Args:
+        session: The database session.
+        topic_id: The ID of the topic to check.
+
+    Returns:
+        `True` if the topic exists, `False` otherwise.
+    """
+
+    return bool(session.execute(select(exists().where(Topic.id == topic_id))).scalar())
+
+
 def get_topic(session: Session, topic_id: int) -> tuple[Topic, int, int] | None:
     """Retrieves a single topic with its children and entry counts.
 
@@ -52,13 +132,17 @@ def get_topic(session: Session, topic_id: int) -> tuple[Topic, int, int] | None:
     """
 
     ParentTopic = aliased(Topic, name="parent_topic")
-    ChildTopic = aliased(Topic, name="child_topic")
 
-    statement = select(
-        ParentTopic,
-        _topic_entries_subquery(ParentTopic, Entry),
-        _topic_children_subquery(ParentTopic, ChildTopic),
-    ).where(ParentTopic.id == topic_id)
+    statement = (
+        select(
+            ParentTopic,
+            func.coalesce(_ENTRY_COUNTS.c.c, 0).label("entries_count"),
+            func.coalesce(_CHILD_COUNTS.c.c, 0).label("children_count"),
+        )
+        .outerjoin(_ENTRY_COUNTS, _ENTRY_COUNTS.c.topic_id == ParentTopic.id)
+        .outerjoin(_CHILD_COUNTS, _CHILD_COUNTS.c.parent_id == ParentTopic.id)
+        .where(ParentTopic.id == topic_id)
+    )
 
     result = session.exec(statement).first()
 
@@ -69,8 +153,13 @@ def get_topic(session: Session, topic_id: int) -> tuple[Topic, int, int] | None:
 
 
 def get_topics(
-    session: Session, *, parent_id: int | None = None, skip: int = 0, limit: int = 100
-) -> list[tuple[Topic, int, int]]:
+    session: Session,
+    *,
+    parent_id: int | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    include_descendants: bool = False,
+) -> Sequence[tuple[Topic, int, int]]:
     """Fetches a paginated list of topics with their children and entry counts.
 
     Args:
@@ -78,6 +167,9 @@ def get_topics(
         parent_id: The ID of the parent topic to filter by. If None, fetches root topics.
         skip: The number of records to skip (for pagination).
         limit: The maximum number of records to return.
+        include_descendants: If True, the counts cover each topic's full
+            subtree (all descendant topics and their entries) instead of
+            only direct children and own entries.
 
     Returns:
         A list of tuples, where each tuple contains:
@@ -85,97 +177,146 @@ def get_topics(
     """
 
     ParentTopic = aliased(Topic, name="parent_topic")
-    ChildTopic = aliased(Topic, name="child_topic")
+
+    if include_descendants:
+        entry_counts, child_counts = _subtree_counts_subqueries()
+    else:
+        entry_counts, child_counts = _ENTRY_COUNTS, _CHILD_COUNTS
 
     statement = (
         select(
             ParentTopic,
-            _topic_entries_subquery(ParentTopic, Entry),
-            _topic_children_subquery(ParentTopic, ChildTopic),
+            func.coalesce(entry_counts.c.c, 0).label("entries_count"),
+            func.coalesce(child_counts.c.c, 0).label("children_count"),
         )
+        .outerjoin(entry_counts, entry_counts.c.topic_id == ParentTopic.id)
+        .outerjoin(child_counts, child_counts.c.parent_id == ParentTopic.id)
         .where(ParentTopic.parent_id == parent_id)
-        .order_by(func.lower(ParentTopic.name))
+        .order_by(ParentTopic.name_ci)
         .offset(skip)
         .limit(limit)
     )
 
-    results = session.exec(statement).all()
-
-    return list(results)
+    return session.exec(statement).all()
 
 
-def sync_topics(session: Session) -> list[Topic]:
+def sync_topics(session: Session) -> Iterator[Topic]:
     """
     Get all the available topics.
 
+    Topics are streamed from the database in batches instead of being
+    materialized into one list, keeping peak memory bounded by the batch
+    size as the topic tree grows.
+
     Args:
         session: The database session.
 
     Returns:
-        A list of all Topic objects.
+        An iterator over all Topic objects.
     """
 
-    statement = select(Topic)
-    results = session.exec(statement).all()
+    statement = select(Topic).execution_options(yield_per=500)
 
-    return list(results)
+    yield from session.exec(statement)
 
 
-def update_topic(session: Session, topic: Topic, topic_in: TopicUpdate) -> Topic:
+def update_topic(session: Session, topic_id: int, topic_in: TopicUpdate) -> Topic:
     """Updates an existing topic in the database.
 
+    The existence check and the update are one UPDATE ... RETURNING
+    statement, so the common case costs a single round-trip.
+
     Args:
         session: The database session.
-        topic: The existing topic model instance to update.
+        topic_id: The ID of the topic to update.
         topic_in: The new data for the topic.
 
     Returns:
         The updated topic model instance.
+
+    Raises:
+        NotFoundError: If no topic with `topic_id` exists.
     """
 
     topic_data = topic_in.model_dump(exclude_unset=True)
 
-    topic.sqlmodel_update(topic_data)
-    session.add(topic)
+    if not topic_data:
+        db_topic = session.get(Topic, topic_id)
+
+        if db_topic is None:
+            raise NotFoundError("Topic not found")
+
+        return db_topic
+
+    statement = (
+        update(Topic).where(Topic.id == topic_id).values(**topic_data).returning(Topic)
+    )
+    db_topic = session.execute(statement).scalar_one_or_none()
+
+    if db_topic is None:
+        raise NotFoundError("Topic not found")
+
     session.commit()
-    session.refresh(topic)
 
-    return topic
+    return db_topic
 
 
-def delete_topic(session: Session, topic: Topic) -> None:
+def delete_topic(session: Session, topic_id: int) -> None:
     """Deletes a topic from the database.
 
     Args:
         session: The database session.
-        topic: The topic model instance to delete.
+        topic_id: The ID of the topic to delete.
+
+    Raises:
+        NotFoundError: If no topic with `topic_id` exists.
     """
 
-    session.delete(topic)
+    statement = delete(Topic).where(Topic.id == topic_id).returning(Topic.id)
+    deleted_id = session.execute(statement).scalar_one_or_none()
+
+    if deleted_id is None:
+        raise NotFoundError("Topic not found")
+
     session.commit()
 
 
-def _topic_entries_subquery(ParentTopic, Entry):
-    return (
-        select(func.count(Entry.id))
-        .where(Entry.topic_id == ParentTopic.id)
-        .correlate(ParentTopic)
-        .scalar_subquery()
-        .label("entries_count")
-    )
+def _subtree_counts_subqueries():
+    """Builds per-root subtree aggregates from a single recursive CTE.
+
+    The CTE materializes every (root topic, descendant topic) pair once,
+    so both counts are computed in one pass instead of one recursive
+    query per topic.
+    """
 
+    topic_tree = select(
+        Topic.id.label("root_id"), Topic.id.label("topic_id")
+    ).cte(name="topic_tree", recursive=True)
 
-def _topic_children_subquery(ParentTopic, ChildTopic):
-    return (
-        select(func.count(ChildTopic.id))
-        .where(ChildTopic.parent_id == ParentTopic.id)
-        .correlate(ParentTopic)
-        .scalar_subquery()
-        .label("children_count")
+    child = aliased(Topic, name="subtree_child")
+    topic_tree = topic_tree.union_all(
+        select(topic_tree.c.root_id, child.id).join(
+            child, child.parent_id == topic_tree.c.topic_id
+        )
     )
 
+    entry_counts = (
+        select(topic_tree.c.root_id.label("topic_id"), func.count().label("c"))
+        .join(Entry, Entry.topic_id == topic_tree.c.topic_id)
+        .group_by(topic_tree.c.root_id)
+        .subquery()
+    )
+    child_counts = (
+        select(topic_tree.c.root_id.label("parent_id"), func.count().label("c"))
+        .where(topic_tree.c.topic_id != topic_tree.c.root_id)
+        .group_by(topic_tree.c.root_id)
+        .subquery()
+    )
 
-def search_topics(session: Session, q: str, limit: int = 10) -> list[Topic]:
+    return entry_counts, child_counts
+
+
+def search_topics(session: Session, q: str, limit: int = 10) -> Sequence[Topic]:
     """
     Searches for topics.
 
@@ -188,10 +329,24 @@ def search_topics(session: Session, q: str, limit: int = 10) -> list[Topic]:
         A list of matching Topic objects.
     """
 
-    search_pattern = f"%{q.lower()}%"
-    statement = (
-        select(Topic).where(func.lower(Topic.name).like(search_pattern)).limit(limit)
+    q = q.strip()
+
+    # The trigram tokenizer cannot match queries shorter than three
+    # characters, so those fall back to the old LIKE scan.
+    if len(q) < 3:
+        search_pattern = f"%{q.lower()}%"
+        statement = select(Topic).where(Topic.name_ci.like(search_pattern)).limit(limit)
+
+        return session.exec(statement).all()
+
+    quoted = q.replace('"', '""')
+    ids = (
+        session.execute(_SEARCH_TOPICS_SQL, {"query": f'"{quoted}"', "limit": limit})
+        .scalars()
+        .all()
     )
-    results = session.exec(statement).all()
 
-    return list(results)
+    if not ids:
+        return []
+
+    return session.exec(select(Topic).where(Topic.id.in_(ids))).all()
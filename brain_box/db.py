@@ -2,19 +2,47 @@ from typing import Generator
 
 from sqlalchemy import Engine
 from sqlalchemy.event import listens_for
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import create_engine, Session, SQLModel
 
 from brain_box.config import settings
 
-engine = create_engine(settings.database.url, connect_args={"check_same_thread": False})
+engine = create_engine(
+    settings.database.url,
+    connect_args={"check_same_thread": False},
+    # Large enough that the app's full statement set stays compiled; the
+    # default cache can evict hot entries once variants accumulate.
+    query_cache_size=1200,
+)
+
+# Sessions come from one preconfigured factory: expire_on_commit=False keeps
+# committed objects readable without a refresh SELECT, and autoflush=False
+# skips the identity-map flush scan on reads (all CRUD paths commit
+# explicitly).
+SessionLocal = sessionmaker(
+    bind=engine, class_=Session, expire_on_commit=False, autoflush=False
+)
 
 
 @listens_for(engine, "connect")
-def enable_foreign_keys(dbapi_con, _):
-    """Ensures ON DELETE CASCADE is enforced by SQLite."""
+def configure_sqlite(dbapi_con, _):
+    """Applies per-connection SQLite PRAGMAs.
+
+    Foreign keys are enforced so ON DELETE CASCADE works; WAL with
+    synchronous=NORMAL keeps commits crash-safe while avoiding an fsync
+    per commit, busy_timeout stops concurrent writers from failing
+    immediately, and the temp_store/mmap/cache settings serve hot pages
+    from memory.
+    """
 
     cursor = dbapi_con.cursor()
     cursor.execute("PRAGMA foreign_keys = ON;")
+    cursor.execute("PRAGMA journal_mode = WAL;")
+    cursor.execute("PRAGMA synchronous = NORMAL;")
+    cursor.execute("PRAGMA busy_timeout = 5000;")
+    cursor.execute("PRAGMA temp_store = MEMORY;")
+    cursor.execute("PRAGMA mmap_size = 268435456;")
+    cursor.execute("PRAGMA cache_size = -65536;")
     cursor.close()
 
 
@@ -23,9 +51,21 @@ def create_db_and_tables(engine: Engine):
 
     SQLModel.metadata.create_all(engine)
 
+    # Databases created before name_ci existed lack the generated column
+    # (create_all never alters existing tables), so add it in place; the
+    # probe keeps this idempotent like the IF NOT EXISTS DDL below.
+    add_name_ci = """
+    ALTER TABLE topic ADD COLUMN name_ci TEXT
+    GENERATED ALWAYS AS (lower(name)) VIRTUAL;
+    """
+
+    create_name_ci_index = """
+    CREATE INDEX IF NOT EXISTS ix_topic_name_ci ON topic (name_ci);
+    """
+
     create_fts = """
     CREATE VIRTUAL TABLE IF NOT EXISTS entry_fts
-    USING fts5(description, tokenize = 'porter');
+    USING fts5(description, tokenize = 'porter', prefix = '2 3');
     """
 
     trigger_insert = """
@@ -49,15 +89,76 @@ def create_db_and_tables(engine: Engine):
     END;
     """
 
+    # The sync triggers only cover rows written after the FTS tables
+    # exist; on a database that already holds data the indexes would
+    # start empty and search would silently miss everything, so each is
+    # backfilled once, when found empty.
+    backfill_entry_fts = """
+    INSERT INTO entry_fts(rowid, description)
+    SELECT id, description FROM entry
+    WHERE NOT EXISTS (SELECT 1 FROM entry_fts);
+    """
+
+    create_topic_fts = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS topic_fts
+    USING fts5(name, tokenize = 'trigram');
+    """
+
+    trigger_topic_insert = """
+    CREATE TRIGGER IF NOT EXISTS topic_ai AFTER INSERT ON topic BEGIN
+        INSERT INTO topic_fts(rowid, name)
+        VALUES (new.id, new.name);
+    END;
+    """
+
+    trigger_topic_delete = """
+    CREATE TRIGGER IF NOT EXISTS topic_ad AFTER DELETE ON topic BEGIN
+        DELETE FROM topic_fts WHERE rowid = old.id;
+    END;
+    """
+
+    trigger_topic_update = """
+    CREATE TRIGGER IF NOT EXISTS topic_au AFTER UPDATE ON topic BEGIN
+        DELETE FROM topic_fts WHERE rowid = old.id;
+        INSERT INTO topic_fts(rowid, name)
+        VALUES (new.id, new.name);
+    END;
+    """
+
+    backfill_topic_fts = """
+    INSERT INTO topic_fts(rowid, name)
+    SELECT id, name FROM topic
+    WHERE NOT EXISTS (SELECT 1 FROM topic_fts);
+    """
+
     with engine.begin() as conn:
+        # table_xinfo, not table_info: only the former lists generated
+        # (hidden) columns, and name_ci is one.
+        columns = conn.exec_driver_sql("PRAGMA table_xinfo(topic);").fetchall()
+        if all(column[1] != "name_ci" for column in columns):
+            conn.exec_driver_sql(add_name_ci)
+        conn.exec_driver_sql(create_name_ci_index)
+
         conn.exec_driver_sql(create_fts)
         conn.exec_driver_sql(trigger_insert)
         conn.exec_driver_sql(trigger_delete)
         conn.exec_driver_sql(trigger_update)
+        conn.exec_driver_sql(backfill_entry_fts)
+        conn.exec_driver_sql(create_topic_fts)
+        conn.exec_driver_sql(trigger_topic_insert)
+        conn.exec_driver_sql(trigger_topic_delete)
+        conn.exec_driver_sql(trigger_topic_update)
+        conn.exec_driver_sql(backfill_topic_fts)
+
+        # Refresh planner statistics so the grouped-count and FTS join
+        # plans stay index-backed as the tables grow. analysis_limit
+        # bounds the scan so startup stays fast on large databases.
+        conn.exec_driver_sql("PRAGMA analysis_limit = 400;")
+        conn.exec_driver_sql("PRAGMA optimize;")
 
 
 def get_session() -> Generator[Session, None, None]:
     """FastAPI dependency to get a database session."""
 
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
@@ -6,7 +6,10 @@ from fastapi import APIRouter, Depends, FastAPI, Response
 from fastapi.staticfiles import StaticFiles as FastAPIStaticFiles
 from starlette.exceptions import HTTPException
 
-from brain_box.db import create_db_and_tables, engine
+from brain_box.db import SessionLocal, create_db_and_tables, engine
+import brain_box.crud.auth as crud_auth
+import brain_box.crud.entry as crud_entry
+import brain_box.crud.topic as crud_topic
 from brain_box.routers.topics import topics_router
 from brain_box.routers.entries import entries_router
 from brain_box.routers.auth import auth_router
@@ -32,6 +35,15 @@ class StaticFiles(FastAPIStaticFiles):
 async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     create_db_and_tables(engine)
 
+    # Run each hot per-request SELECT once with dummy binds so its
+    # compiled form is already cached when the first real request lands.
+    with SessionLocal() as session:
+        crud_topic.get_topic(session, 0)
+        crud_topic.get_topics(session)
+        crud_topic.topic_exists(session, 0)
+        crud_entry.get_entry(session, 0)
+        crud_auth.get_refresh_token_by_hash(session, "")
+
     yield
 
 
@@ -51,13 +63,18 @@ api_router.include_router(entries_router, dependencies=router_deps)
 api_router.include_router(auth_router)
 
 
-@app.head("/health")
+# Empty responses are immutable in practice, so one instance serves every
+# health probe without per-request allocations.
+_HEALTH_OK = Response(status_code=200)
+
+
+@app.head("/health", include_in_schema=False)
 async def health_check():
     """
     Health check endpoint, returns 200 OK if the server is healthy.
     """
 
-    return Response(status_code=200)
+    return _HEALTH_OK
 
 
 app.include_router(api_router)
@@ -2,11 +2,10 @@ from .entry import Entry, EntryRead
 from .topic import Topic, TopicRead
 from .auth import RefreshToken
 
-# needed to resolve forward references to their respective concrete models
-Topic.model_rebuild()
+# needed to resolve forward references to their respective concrete models;
+# only the Read models carry forward references in pydantic fields (the table
+# models' relationships are SQLAlchemy-level and need no rebuild)
 TopicRead.model_rebuild()
-
-Entry.model_rebuild()
 EntryRead.model_rebuild()
 
 __all__ = ["Entry", "Topic", "RefreshToken"]
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Column, Computed, String
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
 
@@ -12,6 +13,14 @@ class Topic(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     name: str
+    name_ci: str | None = Field(
+        default=None,
+        sa_column=Column(
+            "name_ci", String, Computed("lower(name)", persisted=False), index=True
+        ),
+        description="Database-generated lower-case name, kept indexed so "
+        "case-insensitive lookups and ordering are sargable.",
+    )
 
     parent_id: int | None = Field(
         default=None,
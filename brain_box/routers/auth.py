@@ -16,9 +16,41 @@ from brain_box.security import create_access_token, gen_refresh_token, verify_us
 
 auth_router = APIRouter(prefix="/auth", tags=["Auth"])
 
+# /auth/token runs every few minutes per client, so the hash -> expiry
+# mapping is cached in-process to skip the database on repeats. Entries
+# are seeded on login, refilled on database hits, and dropped on logout
+# or expiry. Only SHA-256 hashes are kept, never the tokens themselves.
+#
+# The cache is per-process, so it only runs in single-worker deployments:
+# with several workers, logout could purge just one process's cache while
+# the others kept honoring the revoked token until it expired naturally.
+_RT_CACHE_ENABLED = settings.general.workers == 1
+_RT_CACHE_MAX = 1024
+_rt_expiries: dict[str, datetime] = {}
+
+
+def _rt_hash(refresh_token: str) -> str:
+    """One-shot SHA-256 hex digest of a refresh token, as stored in the DB.
+
+    UTF-8, not ascii: cookie values are client-controlled and may carry
+    arbitrary bytes, which must hash to a miss rather than raise.
+    """
+
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def _cache_rt_expiry(refresh_token_hash: str, expires_at: datetime) -> None:
+    if not _RT_CACHE_ENABLED:
+        return
+
+    if len(_rt_expiries) >= _RT_CACHE_MAX:
+        _rt_expiries.clear()
+
+    _rt_expiries[refresh_token_hash] = expires_at
+
 
 @auth_router.post("/login", response_model=AccessTokenRead)
-async def login(
+def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     response: Response,
     db: Session = Depends(get_session),
@@ -34,14 +66,14 @@ async def login(
         )
 
     refresh_token = gen_refresh_token()
+    refresh_token_hash = _rt_hash(refresh_token)
     ttl = timedelta(minutes=settings.security.refresh_token_ttl)
+    expires_at = datetime.now(timezone.utc) + ttl
     crud_auth.create_refresh_token(
         db,
-        RefreshTokenCreate(
-            hash=hashlib.sha256(refresh_token.encode()).hexdigest(),
-            expires_at=datetime.now(timezone.utc) + ttl,
-        ),
+        RefreshTokenCreate(hash=refresh_token_hash, expires_at=expires_at),
     )
+    _cache_rt_expiry(refresh_token_hash, expires_at)
 
     response.set_cookie(
         key="refresh_token",
@@ -59,7 +91,7 @@ async def login(
 
 
 @auth_router.post("/logout")
-async def logout(
+def logout(
     response: Response,
     refresh_token: Annotated[str | None, Cookie()] = None,
     db: Session = Depends(get_session),
@@ -69,10 +101,9 @@ async def logout(
     if refresh_token is None:
         return {}
 
-    crud_auth.delete_refresh_token_by_hash(
-        db,
-        refresh_token_hash=hashlib.sha256(refresh_token.encode()).hexdigest(),
-    )
+    refresh_token_hash = _rt_hash(refresh_token)
+    _rt_expiries.pop(refresh_token_hash, None)
+    crud_auth.delete_refresh_token_by_hash(db, refresh_token_hash=refresh_token_hash)
     response.delete_cookie(
         key="refresh_token",
         httponly=True,
@@ -84,7 +115,7 @@ async def logout(
 
 
 @auth_router.post("/token", response_model=AccessTokenRead)
-async def token(request: Request, db: Session = Depends(get_session)):
+def token(request: Request, db: Session = Depends(get_session)):
     """Generates an access token for the user."""
 
     invalid_refresh_token_exception = HTTPException(
@@ -96,14 +127,20 @@ async def token(request: Request, db: Session = Depends(get_session)):
     if not refresh_token_cookie:
         raise invalid_refresh_token_exception
 
-    refresh_token_hash = hashlib.sha256(refresh_token_cookie.encode()).hexdigest()
-    refresh_token = crud_auth.get_refresh_token_by_hash(
-        db, refresh_token_hash=refresh_token_hash
-    )
+    refresh_token_hash = _rt_hash(refresh_token_cookie)
+
+    expires_at = _rt_expiries.get(refresh_token_hash)
+    if expires_at is None:
+        refresh_token = crud_auth.get_refresh_token_by_hash(
+            db, refresh_token_hash=refresh_token_hash
+        )
+
+        if refresh_token is not None:
+            expires_at = refresh_token.expires_at.replace(tzinfo=timezone.utc)
+            _cache_rt_expiry(refresh_token_hash, expires_at)
 
-    if refresh_token is None or utils.now() >= refresh_token.expires_at.replace(
-        tzinfo=timezone.utc
-    ):
+    if expires_at is None or utils.now() >= expires_at:
+        _rt_expiries.pop(refresh_token_hash, None)
         raise invalid_refresh_token_exception
 
     ttl = timedelta(minutes=settings.security.access_token_ttl)
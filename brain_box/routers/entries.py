@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session
 
+from brain_box.crud.errors import NotFoundError
 from brain_box.db import get_session
 from brain_box.models.entry import EntryCreate, EntryRead, EntryUpdate
 import brain_box.crud.topic as crud_topic
@@ -18,7 +19,7 @@ entries_router = APIRouter(prefix="/entries")
 def create_entry(entry_in: EntryCreate, db: Session = Depends(get_session)):
     """Create a new  entry and associate it with a topic."""
 
-    if not crud_topic.get_topic(db, entry_in.topic_id):
+    if not crud_topic.topic_exists(db, entry_in.topic_id):
         raise HTTPException(status_code=404, detail="Topic not found")
 
     return crud_entry.create_entry(session=db, entry_in=entry_in)
@@ -64,12 +65,10 @@ def update_entry(
 ):
     """Update an entry's description or move it to a different topic."""
 
-    db_entry = crud_entry.get_entry(session=db, entry_id=entry_id)
-
-    if not db_entry:
-        raise HTTPException(status_code=404, detail="Entry not found")
-
-    return crud_entry.update_entry(session=db, entry=db_entry, entry_in=entry_in)
+    try:
+        return crud_entry.update_entry(session=db, entry_id=entry_id, entry_in=entry_in)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
 @entries_router.delete(
@@ -78,11 +77,9 @@ def update_entry(
 def delete_entry(entry_id: int, db: Session = Depends(get_session)):
     """Delete an entry."""
 
-    db_entry = crud_entry.get_entry(session=db, entry_id=entry_id)
-
-    if not db_entry:
-        raise HTTPException(status_code=404, detail="Entry not found")
-
-    crud_entry.delete_entry(session=db, entry=db_entry)
+    try:
+        crud_entry.delete_entry(session=db, entry_id=entry_id)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
     return None
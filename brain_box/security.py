@@ -1,5 +1,12 @@
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from functools import lru_cache
 from secrets import token_urlsafe
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Annotated
 
 import jwt
@@ -7,18 +14,40 @@ from jwt.exceptions import InvalidTokenError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
-from brain_box import utils
 from brain_box.config import settings
 
 
-password_hash = PasswordHash.recommended()
+# Argon2id with lane parallelism matched to the host's cores instead of
+# the fixed default of 4; m and t keep their recommended values, so
+# hashes stay equally hard to attack while spreading each one across
+# the cores actually present. Verification cost follows the parameters
+# embedded in the stored hash, so this applies to newly minted hashes.
+password_hash = PasswordHash((Argon2Hasher(parallelism=os.cpu_count() or 4),))
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/refresh-token")
 
+# The signing secret and expected subject are fixed for the process
+# lifetime; hoisting them turns per-request attribute chains into local
+# lookups and spares PyJWT a str -> bytes pass per token minted/verified.
+_TOKEN_SECRET = settings.security.token_secret.encode()
+_USERNAME = settings.security.username
+_USERNAME_BYTES = _USERNAME.encode()
+
+# Argon2 verification is deliberately ~100ms of memory-hard work, so
+# recent results are memoized for a short window. Keys are SHA-256
+# digests of (password, hash) — no plaintext is ever retained.
+_VERIFY_CACHE_TTL = 60
+_VERIFY_CACHE_MAX = 256
+_verify_cache: dict[bytes, tuple[float, bool]] = {}
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify provided password against the hashed password.
 
+    Repeat verifications of the same credentials within a short TTL are
+    served from an in-process cache instead of re-running Argon2.
+
     Args:
         plain_password: Plain user provided password.
         hashed_password: Hashed password.
@@ -27,7 +56,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         `True` if verification was successful, `False` otherwise.
     """
 
-    return password_hash.verify(plain_password, hashed_password)
+    key = hashlib.sha256(f"{plain_password}\x00{hashed_password}".encode()).digest()
+    now = time.monotonic()
+
+    cached = _verify_cache.get(key)
+    if cached is not None and now - cached[0] < _VERIFY_CACHE_TTL:
+        return cached[1]
+
+    verified = password_hash.verify(plain_password, hashed_password)
+
+    if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+        _verify_cache.clear()
+    _verify_cache[key] = (now, verified)
+
+    return verified
 
 
 def get_password_hash(password: str) -> str:
@@ -43,6 +85,14 @@ def get_password_hash(password: str) -> str:
     return password_hash.hash(password)
 
 
+# Each os.urandom call is a getrandom syscall; drawing token bytes from
+# a pooled read amortizes it across many tokens. The bytes still come
+# straight from the kernel CSPRNG — only the read is batched.
+_RT_BYTES = 64
+_token_pool = bytearray()
+_token_pool_lock = threading.Lock()
+
+
 def gen_refresh_token() -> str:
     """Generates a cryptographically safe refresh token.
 
@@ -50,12 +100,32 @@ def gen_refresh_token() -> str:
         A refresh token.
     """
 
-    return token_urlsafe(64)
+    with _token_pool_lock:
+        if len(_token_pool) < _RT_BYTES:
+            _token_pool.extend(os.urandom(_RT_BYTES * 256))
+
+        chunk = bytes(_token_pool[:_RT_BYTES])
+        del _token_pool[:_RT_BYTES]
+
+    return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii")
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """Hash of a throwaway secret, used to equalize timing on username
+    mismatch. Built lazily so importing the module does not pay for an
+    Argon2 hash."""
+
+    return password_hash.hash(token_urlsafe(16))
 
 
 def verify_user(username: str, password: str) -> bool:
     """Verifies whether user are who they claim they are.
 
+    The username comparison is constant-time, and a mismatch still runs
+    a password verification against a dummy hash, so response timing
+    does not reveal whether the username was the wrong half.
+
     Args:
         username: The provided username.
         password: The provided password.
@@ -68,7 +138,9 @@ def verify_user(username: str, password: str) -> bool:
 
     if hashed_password is None or hashed_password.strip() == "":
         return True
-    if username != settings.security.username:
+
+    if not hmac.compare_digest(username.encode(), _USERNAME_BYTES):
+        verify_password(password, _dummy_hash())
         return False
 
     return verify_password(password, hashed_password)
@@ -88,22 +160,42 @@ def create_access_token(
         The token string.
     """
 
+    # JWT NumericDate claims are plain unix seconds; one clock read and
+    # two ints replace two datetime constructions per token.
+    now_ts = time.time()
     to_encode = {
         "sub": sub,
-        "exp": datetime.now(timezone.utc) + ttl,
-        "iat": utils.now(),
+        "exp": int(now_ts + ttl.total_seconds()),
+        "iat": int(now_ts),
     }
 
-    encoded_token = jwt.encode(
-        to_encode, settings.security.token_secret, algorithm="HS256"
-    )
+    encoded_token = jwt.encode(to_encode, _TOKEN_SECRET, algorithm="HS256")
 
     return encoded_token
 
 
+# A token's validity is deterministic until its exp claim passes, so
+# successfully decoded tokens are remembered and repeat requests with the
+# same Bearer skip the signature check and JSON parse entirely.
+_TOKEN_CACHE_MAX = 1024
+_token_cache: dict[str, tuple[float, str]] = {}
+
+# Raised by reference — FastAPI does not mutate raised HTTPExceptions,
+# so one instance serves every rejected request without allocating an
+# exception and headers dict per call.
+_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
 async def is_authorized(access_token: Annotated[str, Depends(oauth2_scheme)]):
     """Checks whether user successfully logged in or not and hence is authorized or not.
 
+    Tokens that already passed validation are cached until their expiry,
+    so only the first request per token pays for the full decode.
+
     Args:
         access_token: The access token provided using `Authorization` header.
 
@@ -111,21 +203,28 @@ async def is_authorized(access_token: Annotated[str, Depends(oauth2_scheme)]):
         HTTPException: In case access token is invalid or expired.
     """
 
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    cached = _token_cache.get(access_token)
+    if cached is not None:
+        exp, sub = cached
+
+        if time.time() < exp and sub == _USERNAME:
+            return
+
+        _token_cache.pop(access_token, None)
 
     try:
-        payload = jwt.decode(
-            access_token, settings.security.token_secret, algorithms=["HS256"]
-        )
+        payload = jwt.decode(access_token, _TOKEN_SECRET, algorithms=["HS256"])
 
         sub = payload.get("sub")
 
-        if sub != settings.security.username:
-            raise credentials_exception
+        if sub != _USERNAME:
+            raise _CREDENTIALS_EXC
+
+        exp = payload.get("exp")
+        if exp is not None:
+            if len(_token_cache) >= _TOKEN_CACHE_MAX:
+                _token_cache.clear()
+            _token_cache[access_token] = (exp, sub)
 
     except InvalidTokenError:
-        raise credentials_exception
+        raise _CREDENTIALS_EXC
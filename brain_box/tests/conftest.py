@@ -1,7 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, StaticPool, create_engine
+from sqlalchemy import event, insert
+from sqlmodel import Session, StaticPool, create_engine
 
+from brain_box import models
 from brain_box.db import create_db_and_tables, get_session
 from brain_box.main import app
 
@@ -9,8 +11,19 @@ from brain_box.main import app
 DATABASE_URL = "sqlite:///:memory:"
 
 
-@pytest.fixture(scope="function", name="session")
-def session_fixture():
+def seed_topics(session: Session, names: list[str]) -> None:
+    """Inserts topics by name in one executemany, skipping per-object
+    unit-of-work bookkeeping; for tests that only need rows to exist."""
+
+    session.execute(insert(models.Topic), [{"name": name} for name in names])
+    session.commit()
+
+
+@pytest.fixture(scope="session", name="engine")
+def engine_fixture():
+    """One engine and one schema build for the whole suite; each test
+    isolates itself transactionally instead of re-running DDL."""
+
     engine = create_engine(
         DATABASE_URL,
         echo=False,
@@ -18,22 +31,55 @@ def session_fixture():
         poolclass=StaticPool,
     )
 
+    # pysqlite's implicit transaction handling breaks SAVEPOINTs; take
+    # over BEGIN emission so the per-test savepoint rollback works (the
+    # documented SQLAlchemy recipe for transactional SQLite tests).
+    @event.listens_for(engine, "connect")
+    def _do_connect(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     create_db_and_tables(engine)
 
-    with Session(engine) as session:
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="function", name="session")
+def session_fixture(engine):
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    # Commits inside the test release savepoints on this connection, so
+    # rolling back the outer transaction wipes everything the test wrote.
+    with Session(
+        bind=connection, join_transaction_mode="create_savepoint"
+    ) as session:
         yield session
 
-    SQLModel.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session", name="started_app")
+def started_app_fixture():
+    """Runs ASGI startup once for the whole suite."""
+
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(scope="function", name="client")
-def client_fixture(session: Session):
+def client_fixture(started_app: TestClient, session: Session):
     def get_session_override():
         return session
 
     app.dependency_overrides[get_session] = get_session_override
 
-    with TestClient(app) as client:
-        yield client
+    yield started_app
 
     app.dependency_overrides.clear()
@@ -1,7 +1,9 @@
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from brain_box import models
+from brain_box.tests.conftest import seed_topics
 
 
 def test_create_and_read_topic(client: TestClient):
@@ -89,8 +91,7 @@ def test_read_topics_filters_by_parent_id(client: TestClient, session: Session):
 
 
 def test_read_topics_pagination(client: TestClient, session: Session):
-    session.add_all([models.Topic(name=f"Topic {i}") for i in range(5)])
-    session.commit()
+    seed_topics(session, [f"Topic {i}" for i in range(5)])
 
     response = client.get("/api/topics/?limit=2")
     assert response.status_code == 200
@@ -105,61 +106,48 @@ def test_read_topics_pagination(client: TestClient, session: Session):
     assert data[0]["name"] == "Topic 2"
 
 
-def test_search_topics_happy_path(client: TestClient, session: Session):
-    session.add_all(
-        [
-            models.Topic(name="Python Programming"),
-            models.Topic(name="JavaScript Essentials"),
-            models.Topic(name="Another Python Topic"),
-        ]
-    )
-    session.commit()
-
-    response = client.get("/api/topics/search/?q=python")
-
-    assert response.status_code == 200
-    results = response.json()
-    assert len(results) == 2
-    assert results[0]["name"] == "Python Programming"
-    assert results[1]["name"] == "Another Python Topic"
-
-
-def test_search_topics_case_insensitive(client: TestClient, session: Session):
-    session.add(models.Topic(name="Cooking"))
-    session.commit()
-
-    response = client.get("/api/topics/search/?q=COOK")
-
-    assert response.status_code == 200
-    results = response.json()
-    assert len(results) == 1
-    assert results[0]["name"] == "Cooking"
-
-
-def test_search_topics_no_results(client: TestClient, session: Session):
-    session.add(models.Topic(name="Go Language"))
-    session.commit()
-
-    response = client.get("/api/topics/search/?q=ruby")
-
-    assert response.status_code == 200
-    assert response.json() == []
-
-
-def test_search_topics_uses_limit(client: TestClient, session: Session):
-    session.add_all(
-        [
-            models.Topic(name="SQL Basics"),
-            models.Topic(name="Advanced SQL"),
-            models.Topic(name="NoSQL Databases"),
-        ]
-    )
-    session.commit()
+@pytest.mark.parametrize(
+    ("seed", "params", "expected_names"),
+    [
+        pytest.param(
+            ["Python Programming", "JavaScript Essentials", "Another Python Topic"],
+            {"q": "python"},
+            ["Python Programming", "Another Python Topic"],
+            id="happy-path",
+        ),
+        pytest.param(
+            ["Cooking"],
+            {"q": "COOK"},
+            ["Cooking"],
+            id="case-insensitive",
+        ),
+        pytest.param(
+            ["Go Language"],
+            {"q": "ruby"},
+            [],
+            id="no-results",
+        ),
+        pytest.param(
+            ["SQL Basics", "Advanced SQL", "NoSQL Databases"],
+            {"q": "sql", "limit": 2},
+            ["SQL Basics", "Advanced SQL"],
+            id="uses-limit",
+        ),
+    ],
+)
+def test_search_topics(
+    client: TestClient,
+    session: Session,
+    seed: list[str],
+    params: dict,
+    expected_names: list[str],
+):
+    seed_topics(session, seed)
 
-    response = client.get("/api/topics/search/?q=sql&limit=2")
+    response = client.get("/api/topics/search/", params=params)
 
     assert response.status_code == 200
-    assert len(response.json()) == 2
+    assert [topic["name"] for topic in response.json()] == expected_names
 
 
 def test_search_topics_validation_error_missing_q(client: TestClient):
@@ -1,8 +1,14 @@
 from datetime import datetime, timezone
 import re
+import string
 
 _REGEX_ALNUM = re.compile(r"\w+", re.UNICODE)
 
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_ASCII_TRANS = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if c not in _WORD_CHARS}
+)
+
 
 def now():
     """Generate current date and time."""
@@ -21,6 +27,12 @@ def sanitize_alnum(text: str) -> str:
         str: A sanitized alnum string.
     """
 
+    # ASCII input (the common case for search queries) is handled by a
+    # prebuilt translation table, which runs in C instead of the regex
+    # engine; everything else keeps the unicode-aware regex.
+    if text.isascii():
+        return " ".join(text.translate(_ASCII_TRANS).split())
+
     tokens = _REGEX_ALNUM.findall(text)
 
     return " ".join(tokens)